@@ -19,5 +19,5 @@ class Client:
         response = await self.httpClient.get(urljoin(self.host, cls.endpoint_path))
         async with response:
             response.raise_for_status()
-            text = await response.text()
-            return readDataclass(cls, text)
+            data = await response.read()
+            return readDataclass(cls, data)
@@ -1,55 +1,156 @@
-from dataclasses import fields, is_dataclass
-from typing import ClassVar, Literal, cast, List, Type, TypeVar
-from python_switchos.utils import hex_to_bool_list, hex_to_ip, hex_to_mac, hex_to_option, hex_to_str, process_int, str_to_json
+from copy import copy
+from dataclasses import Field, fields, is_dataclass
+from functools import lru_cache
+from sys import intern
+from types import UnionType
+from typing import Any, Callable, ClassVar, Dict, Literal, Mapping, Tuple, Union, cast, get_args, get_origin, get_type_hints, List, Type, TypeVar
+from python_switchos.utils import hex_to_bool_list, hex_to_ip, hex_to_ip_list, hex_to_mac, hex_to_mac_list, hex_to_str, process_int, process_int_list, process_int_scalar, str_to_json
 
 def endpoint(path: str):
-    """Decorator to add an endpoint path to a class."""
+    """Decorator to add an endpoint path to a class and prepare its parser."""
     def decorator(cls):
         cls.endpoint_path = path
+        if is_dataclass(cls):
+            _compile(cls)
         return cls
     return decorator
 
 class SwitchOSEndpoint:
     """Represents an abstract endpoint of SwitchOS Lite."""
+    __slots__ = ()
     endpoint_path: ClassVar[str]
 
 T = TypeVar("T", bound=SwitchOSEndpoint)
 
-FieldType = Literal["bool", "str"]
+FieldType = Literal["bool", "int", "str", "option", "mac", "ip"]
 
-def readDataclass(cls: Type[T], data: str) -> T:
-    """Parses the given JSON-Like string and returns an instance of the given endpoint class."""
+def _parse_str(value, port_count: int, arg: None):
+    if isinstance(value, list):
+        return list(map(hex_to_str, cast(List[str], value)))
+    return hex_to_str(value)
+
+def _parse_option(value, port_count: int, options: Tuple[Any, ...]):
+    # Same as hex_to_option, with the Literal resolved once per field
+    count = len(options)
+    if isinstance(value, list):
+        return [options[v] if v < count else None for v in cast(List[int], value)]
+    return options[value] if value < count else None
+
+def _parse_mac(value, port_count: int, arg: None):
+    if isinstance(value, list):
+        return hex_to_mac_list(cast(List[str], value))
+    return hex_to_mac(value)
+
+def _parse_ip(value, port_count: int, arg: None):
+    if isinstance(value, list):
+        return hex_to_ip_list(cast(List[int], value))
+    return hex_to_ip(value)
+
+# Value parser for the types that are not inlined, called as handler(value, port_count, arg)
+_HANDLERS: Dict[FieldType, Callable[[Any, int, Any], Any]] = {
+    "str": _parse_str,
+    "option": _parse_option,
+    "mac": _parse_mac,
+    "ip": _parse_ip,
+}
+
+# Converts the field metadata once into the arg passed to the handler of its type
+_ARGS: Dict[FieldType, Callable[[Mapping[str, Any]], Any]] = {
+    "option": lambda metadata: tuple(intern(o) if isinstance(o, str) else o for o in get_args(metadata.get("options"))),
+}
+
+Parser = Callable[[Dict[str, Any], int], Any]
+
+def _int_helper(annotation: Any) -> Callable[..., Any]:
+    """Returns the process_int variant matching the annotation of an int field.
+
+    Optional and other unions are unwrapped. If the annotation does not tell whether the field
+    holds one value or one per port (unresolved, Any, mixed), process_int checks every value.
+    """
+    args = get_args(annotation) if get_origin(annotation) in (Union, UnionType) else (annotation,)
+    shapes = {
+        True if get_origin(a) is list else False if isinstance(a, type) else None
+        for a in args if a is not type(None)
+    }
+    if shapes == {True}:
+        return process_int_list
+    if shapes == {False}:
+        return process_int_scalar
+    return process_int
+
+def _expression(f: Field, i: int, namespace: Dict[str, Any], hints: Dict[str, Any]) -> str:
+    """Returns the source of the expression converting `value` for the i-th field.
+
+    Conversions that reduce to a single call or to the raw value are inlined, all others
+    call the handler of their type. Names the expression refers to are added to namespace.
+    """
+    type = f.metadata.get("type")
+    if type == "bool":
+        namespace["hex_to_bool_list"] = hex_to_bool_list
+        return "hex_to_bool_list(value, portCount)"
+    if type == "int":
+        signed, bits, scale = f.metadata.get("signed"), f.metadata.get("bits"), f.metadata.get("scale")
+        if not (signed and bits) and scale is None:
+            return "value"
+        namespace[f"handler{i}"] = _int_helper(hints.get(f.name))
+        namespace[f"arg{i}"] = (signed, bits, scale)
+        return f"handler{i}(value, *arg{i})"
+    if type not in _HANDLERS:
+        return "value"
+    namespace[f"handler{i}"] = _HANDLERS[type]
+    namespace[f"arg{i}"] = _ARGS[type](f.metadata) if type in _ARGS else None
+    return f"handler{i}(value, portCount, arg{i})"
+
+@lru_cache(maxsize=None)
+def _compile(cls: type) -> Parser:
+    """Generates a parser function specialized for the fields of the given dataclass.
+
+    The field loop is unrolled when the class is decorated, so parsing a response runs
+    straight-line code without walking the fields and their metadata again.
+    """
     if not is_dataclass(cls):
         raise TypeError(f"{cls} is not a dataclass")
-    dict = {}
+    try:
+        hints = get_type_hints(cls)
+    except (NameError, TypeError):
+        # Unresolvable string annotations, int fields then dispatch per value
+        hints = {}
+    namespace: Dict[str, Any] = {"cls": cls}
+    lines = [f"def parse_{cls.__name__}(jsonData, portCount):", "    kwargs = {}"]
+    for i, f in enumerate(fields(cls)):
+        first, *alternates = f.metadata.get("name")
+        lines.append(f"    value = jsonData.get({first!r})")
+        for key in alternates:
+            lines += ["    if value is None:", f"        value = jsonData.get({key!r})"]
+        lines += [
+            "    if value is not None:",
+            f"        kwargs[{f.name!r}] = {_expression(f, i, namespace, hints)}",
+        ]
+    lines.append("    return cls(**kwargs)")
+    exec(compile("\n".join(lines), f"<parser {cls.__qualname__}>", "exec"), namespace)
+    return namespace[f"parse_{cls.__name__}"]
+
+def readDataclass(cls: Type[T], data: str | bytes) -> T:
+    """Parses the given JSON-Like string or raw response body and returns an instance of the given endpoint class."""
+    parse = _compile(cls)
     jsonData = str_to_json(data)
     firstArrValue = next((v for v in jsonData.values() if isinstance(v, list)), None)
     portCount: int = len(firstArrValue) if isinstance(firstArrValue, list) else 0
-    for f in fields(cls):
-        metadata = f.metadata
-        names = metadata.get("name")
-        value = next((jsonData.get(name) for name in names if name in jsonData), None)
-        if value is None:
-            continue
-        type: FieldType = cast(FieldType, metadata.get("type"))
-        match type:
-            case "bool":
-                value = hex_to_bool_list(value, portCount)
-            case "int":
-                value = process_int(value, metadata.get("signed"), metadata.get("bits"), metadata.get("scale"))
-            case "str":
-                if isinstance(value, list):
-                    value = list(map(hex_to_str, cast(List[str], value)))
-                else:
-                    value = hex_to_str(value)
-            case "option":
-                if isinstance(value, list):
-                    value = list(map(lambda v: hex_to_option(v, metadata.get("options")), cast(List[int], value)))
-                else:
-                    value = hex_to_option(value, metadata.get("options"))
-            case "mac":
-                value = hex_to_mac(value)
-            case "ip":
-                value = hex_to_ip(value)
-        dict[f.name] = value
-    return cls(**dict)
+    return parse(jsonData, portCount)
+
+@lru_cache(maxsize=64)
+def _readDataclassShared(cls: Type[T], data: str | bytes) -> T:
+    return readDataclass(cls, data)
+
+def readDataclassCached(cls: Type[T], data: str | bytes) -> T:
+    """Same as readDataclass, but reuses the previous result if the same response was parsed before.
+
+    Unchanged responses of a polled endpoint cost a hash, a lookup and a copy instead of a full parse.
+    Every call returns its own copy, including the per port lists, so callers may modify it.
+    """
+    instance = copy(_readDataclassShared(cls, data))
+    for f in fields(instance):
+        value = getattr(instance, f.name)
+        if isinstance(value, list):
+            setattr(instance, f.name, value.copy())
+    return instance
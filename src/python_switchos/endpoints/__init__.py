@@ -0,0 +1,14 @@
+from typing import Dict, Optional, Type
+from python_switchos.endpoint import SwitchOSEndpoint
+from python_switchos.endpoints.link import LinkEndpoint
+from python_switchos.endpoints.poe import PoEEndpoint
+from python_switchos.endpoints.sys import SystemEndpoint
+
+# Endpoint class for each endpoint path
+_PATH_TO_CLS: Dict[str, Type[SwitchOSEndpoint]] = {
+    cls.endpoint_path: cls for cls in (LinkEndpoint, PoEEndpoint, SystemEndpoint)
+}
+
+def resolve_endpoint(path: str) -> Optional[Type[SwitchOSEndpoint]]:
+    """Returns the endpoint class for the given path (e.g. "link.b"), or None if the path is unknown."""
+    return _PATH_TO_CLS.get(path)
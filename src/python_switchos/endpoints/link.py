@@ -6,7 +6,7 @@ from python_switchos.endpoint import SwitchOSEndpoint, endpoint
 Speed = Literal["10M", "100M", "1G", "10G", "200M", "2.5G", "5G"]
 
 @endpoint("link.b")
-@dataclass
+@dataclass(slots=True)
 class LinkEndpoint(SwitchOSEndpoint):
     """Represents the endpoint providing basic information for each individual port."""
     enabled: List[bool] = field(metadata={"name": ["en", "i01"], "type": "bool"})
@@ -24,7 +24,7 @@ State = Literal[
 ]
 
 @endpoint("poe.b")
-@dataclass
+@dataclass(slots=True)
 class PoEEndpoint(SwitchOSEndpoint):
     """Represents the endpoint providing POE information for each individual port."""
     out: List[PoEOut] = field(metadata={"name": ["poe", "i01"], "type": "option", "options": PoEOut}, default=None)
@@ -6,7 +6,7 @@ from python_switchos.endpoint import SwitchOSEndpoint, endpoint
 AddressAcquisition = Literal["DHCP_FALLBACK", "STATIC", "DHCP"]
 
 @endpoint("sys.b")
-@dataclass
+@dataclass(slots=True)
 class SystemEndpoint(SwitchOSEndpoint):
     """Represents the endpoint with system information."""
 
@@ -14,6 +14,9 @@ class HttpResponse(ABC):
     async def text(self) -> str:
         pass
 
+    async def read(self) -> bytes:
+        return (await self.text()).encode()
+
 class HttpClient(ABC):
     @abstractmethod
     async def get(self, url) -> HttpResponse:
@@ -45,6 +48,9 @@ try:
         async def text(self) -> str:
             return await self.response.text()
 
+        async def read(self) -> bytes:
+            return await self.response.read()
+
     class AioHttpClient(HttpClient):
         session: aiohttp.ClientSession
 
@@ -90,10 +96,13 @@ try:
         async def text(self) -> str:
             return self.response.text
 
+        async def read(self) -> bytes:
+            return self.response.content
+
     class HttpxClient(HttpClient):
         client: httpx.AsyncClient
 
-        def __init__(self, client: httpx.AsyncClient, auth: httpx.DigestAuth | httpx.UseClientDefault):
+        def __init__(self, client: httpx.AsyncClient, auth: "httpx.DigestAuth | httpx._client.UseClientDefault"):
             assert isinstance(client, httpx.AsyncClient)
             self.client = client
             self.auth = auth
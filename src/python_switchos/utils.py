@@ -1,6 +1,21 @@
+import json
 import re
-import demjson3
-from typing import List, Type, get_args
+from socket import inet_ntoa
+from struct import Struct
+from functools import lru_cache
+from typing import List, Tuple, Type, get_args
+
+# Bits of every byte value, least significant bit first
+_BOOL_LUT = tuple(tuple(bool((byte >> bit) & 1) for bit in range(8)) for byte in range(256))
+
+@lru_cache(maxsize=1024)
+def _bool_bits(value: int, length: int) -> Tuple[bool, ...]:
+    """Decodes a bitmask once; port masks repeat across fields and polls."""
+    count = max(length, value.bit_length(), 1)
+    result: List[bool] = []
+    for byte in value.to_bytes((count + 7) // 8, "little"):
+        result += _BOOL_LUT[byte]
+    return tuple(result[:count])
 
 def hex_to_bool_list(value: int, length: int = 24) -> List[bool]:
     """Converts an integer into a list of booleans.
@@ -12,7 +27,7 @@ def hex_to_bool_list(value: int, length: int = 24) -> List[bool]:
     Returns:
         List of booleans of the specified length.
     """
-    return [c == "1" for c in f"{value:0{length}b}"][::-1]
+    return list(_bool_bits(value, length))
 
 def hex_to_str(value: str) -> str:
     """Converts a hex-encoded string to a UTF-8 decoded string.
@@ -25,6 +40,11 @@ def hex_to_str(value: str) -> str:
     """
     return bytes.fromhex(value).decode().rstrip("\x00")
 
+@lru_cache(maxsize=None)
+def _literal_options(type: Type) -> Tuple:
+    """Returns the options of a Literal type, introspected only once per type."""
+    return get_args(type)
+
 def hex_to_option(value: int, type: Type) -> str | None:
     """Converts an integer into an option of a given Literal type.
 
@@ -35,7 +55,7 @@ def hex_to_option(value: int, type: Type) -> str | None:
     Returns:
         The option corresponding to the index, or None if index is out of range.
     """
-    options = get_args(type)
+    options = _literal_options(type)
     idx = value
     return None if idx >= len(options) else options[idx]
 
@@ -48,7 +68,23 @@ def hex_to_mac(value: str) -> str:
     Returns:
         The MAC address formatted with colons.
     """
-    return ":".join(re.findall("..", value.upper()))
+    return bytes.fromhex(value).hex(":").upper()
+
+def hex_to_mac_list(values: List[str]) -> List[str]:
+    """Converts a list of hex strings to colon-separated MAC addresses.
+
+    All addresses are decoded and formatted by a single bytes.fromhex call.
+
+    Args:
+        values: Hex strings representing MAC addresses.
+
+    Returns:
+        The MAC addresses formatted with colons.
+    """
+    if any(len(v) != 12 for v in values):
+        return [hex_to_mac(v) for v in values]
+    formatted = bytes.fromhex("".join(values)).hex(":").upper()
+    return [formatted[i:i + 17] for i in range(0, len(formatted), 18)]
 
 def process_int(value: int | List[int], signed: bool = False, bits: int = None, scale: int | float = None) -> int | float | List[int] | List[float]:
     """Processes integer values with optional signed conversion and scaling.
@@ -62,19 +98,38 @@ def process_int(value: int | List[int], signed: bool = False, bits: int = None,
     Returns:
         The processed value(s).
     """
+    if isinstance(value, list):
+        return process_int_list(value, signed, bits, scale)
+    return process_int_scalar(value, signed, bits, scale)
+
+def process_int_scalar(value: int, signed: bool = False, bits: int = None, scale: int | float = None) -> int | float:
+    """Processes a single integer with optional signed conversion and scaling.
+
+    Same as process_int, for callers that already know the value is not a list.
+    """
+    if signed and bits and value >= 1 << (bits - 1):
+        value = value - (1 << bits)
+    if scale is not None:
+        return value / scale
+    return value
+
+def process_int_list(values: List[int], signed: bool = False, bits: int = None, scale: int | float = None) -> List[int] | List[float]:
+    """Processes a list of integers with optional signed conversion and scaling in a single pass.
+
+    Same as process_int, for callers that already know the value is a list.
+    """
     if signed and bits:
         half = 1 << (bits - 1)
         full = 1 << bits
-        if isinstance(value, list):
-            value = [v - full if v >= half else v for v in value]
-        elif value >= half:
-            value = value - full
+        if scale is not None:
+            return [(v - full if v >= half else v) / scale for v in values]
+        return [v - full if v >= half else v for v in values]
     if scale is not None:
-        if isinstance(value, list):
-            value = [v / scale for v in value]
-        else:
-            value = value / scale
-    return value
+        return [v / scale for v in values]
+    return values
+
+# IPv4 addresses are sent as little-endian 32-bit integers
+_pack_ip = Struct("<I").pack
 
 def hex_to_ip(value: int) -> str:
     """Converts an integer into its corresponding IPv4 address string.
@@ -85,16 +140,157 @@ def hex_to_ip(value: int) -> str:
     Returns:
         The IPv4 address in dotted-decimal notation.
     """
-    ip_bytes = value.to_bytes(4, byteorder="little")
-    return ".".join(str(b) for b in ip_bytes)
+    return inet_ntoa(_pack_ip(value))
+
+def hex_to_ip_list(values: List[int]) -> List[str]:
+    """Converts a list of integers into IPv4 address strings.
+
+    Args:
+        values: Integers representing IPv4 addresses (byteorder=little).
+
+    Returns:
+        The IPv4 addresses in dotted-decimal notation.
+    """
+    pack = _pack_ip
+    return [inet_ntoa(pack(v)) for v in values]
+
+# Parts of a SwitchOS response that differ from JSON: single-quoted strings without
+# escapes or double quotes, hex integers and unquoted keys. Double-quoted strings
+# are matched as a whole so their content is left untouched.
+_JSON_FIXUP_RE = re.compile(r"""'([^'"\\]*)'|("(?:[^"\\]|\\.)*")|\b0[xX]([0-9a-fA-F]+)|([A-Za-z_]\w*)(?=\s*:)""")
+
+def _json_fixup(match: re.Match) -> str:
+    text = match.group(1)
+    if text is not None:
+        return f'"{text}"'
+    if match.group(2):
+        return match.group(2)
+    if match.group(3):
+        return str(int(match.group(3), 16))
+    return f'"{match.group(4)}"'
 
-def str_to_json(value: str) -> dict | None:
-    """Parses a JSON-like string using demjson3 for tolerant decoding.
+# One token of the SwitchOS JSON dialect, with optional leading whitespace
+_TOKEN_RE = re.compile(r"""\s*(?:
+    (?P<punct>[{}\[\],:])
+  | '(?P<squote>(?:[^'\\]|\\.)*)'
+  | "(?P<dquote>(?:[^"\\]|\\.)*)"
+  | (?P<hex>-?0[xX][0-9a-fA-F]+)
+  | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<word>[A-Za-z_$][\w$]*)
+)""", re.VERBOSE)
+
+_ESCAPE_RE = re.compile(r"\\(?:x([0-9a-fA-F]{2})|u([0-9a-fA-F]{4})|(.))", re.DOTALL)
+_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", "b": "\b", "f": "\f", "0": "\0"}
+_WORDS = {"true": True, "false": False, "null": None}
+
+def _unescape(match: re.Match) -> str:
+    code = match.group(1) or match.group(2)
+    if code:
+        return chr(int(code, 16))
+    char = match.group(3)
+    return _ESCAPES.get(char, char)
+
+def _token(value: str, pos: int) -> re.Match:
+    match = _TOKEN_RE.match(value, pos)
+    if match is None:
+        raise ValueError(f"Unexpected character at position {pos}")
+    return match
+
+def _parse_key(value: str, pos: int) -> tuple:
+    match = _token(value, pos)
+    kind = match.lastgroup
+    if kind == "word" or kind == "hex" or kind == "number":
+        key = match.group(kind)
+    elif kind == "squote" or kind == "dquote":
+        key = match.group(kind)
+        if "\\" in key:
+            key = _ESCAPE_RE.sub(_unescape, key)
+    else:
+        raise ValueError(f"Expected key at position {match.start(kind)}")
+    match = _token(value, match.end())
+    if match.group("punct") != ":":
+        raise ValueError(f"Expected ':' at position {match.start()}")
+    return key, match.end()
+
+def _parse_value(value: str, pos: int) -> tuple:
+    match = _token(value, pos)
+    kind = match.lastgroup
+    pos = match.end()
+    if kind == "hex":
+        return int(match.group(kind), 16), pos
+    if kind == "squote" or kind == "dquote":
+        text = match.group(kind)
+        return (_ESCAPE_RE.sub(_unescape, text) if "\\" in text else text), pos
+    if kind == "number":
+        number = match.group(kind)
+        return (int(number) if number.lstrip("-").isdigit() else float(number)), pos
+    if kind == "word":
+        word = match.group(kind)
+        if word not in _WORDS:
+            raise ValueError(f"Unexpected word '{word}' at position {match.start(kind)}")
+        return _WORDS[word], pos
+    punct = match.group(kind)
+    if punct == "{":
+        result = {}
+        while True:
+            match = _token(value, pos)
+            if match.group("punct") == "}":
+                return result, match.end()
+            key, pos = _parse_key(value, pos)
+            result[key], pos = _parse_value(value, pos)
+            match = _token(value, pos)
+            punct = match.group("punct")
+            pos = match.end()
+            if punct == "}":
+                return result, pos
+            if punct != ",":
+                raise ValueError(f"Expected ',' or '}}' at position {match.start()}")
+    if punct == "[":
+        items = []
+        while True:
+            match = _token(value, pos)
+            if match.group("punct") == "]":
+                return items, match.end()
+            item, pos = _parse_value(value, pos)
+            items.append(item)
+            match = _token(value, pos)
+            punct = match.group("punct")
+            pos = match.end()
+            if punct == "]":
+                return items, pos
+            if punct != ",":
+                raise ValueError(f"Expected ',' or ']' at position {match.start()}")
+    raise ValueError(f"Unexpected '{punct}' at position {match.start(kind)}")
+
+def _reject_constant(name: str):
+    # The pure-Python parser does not accept NaN/Infinity, so neither does the fast path
+    raise ValueError(f"Unexpected constant {name}")
+
+def str_to_json(value: str | bytes) -> dict | list:
+    """Parses the JSON-like response format of SwitchOS.
+
+    Besides standard JSON, unquoted keys, single-quoted strings and hexadecimal
+    integers (0x...) are accepted, and trailing commas are tolerated.
+    Typical responses are rewritten to JSON by a single regex pass and decoded
+    by the C-accelerated json module; anything else is handled by a tolerant
+    pure-Python parser.
 
     Args:
-        value: JSON-like string to parse.
+        value: JSON-like string to parse, or the raw response body as bytes.
 
     Returns:
-        Parsed JSON as a dictionary, or None if parsing fails.
+        Parsed JSON as a dictionary (or list for list endpoints).
+
+    Raises:
+        ValueError: If the string is not valid.
     """
-    return demjson3.decode(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        value = str(value, "utf-8")
+    try:
+        return json.loads(_JSON_FIXUP_RE.sub(_json_fixup, value), parse_constant=_reject_constant)
+    except ValueError:
+        pass
+    result, pos = _parse_value(value, 0)
+    if value[pos:].strip():
+        raise ValueError(f"Unexpected data at position {pos}")
+    return result
@@ -0,0 +1,24 @@
+"""Parse throughput benchmarks for the endpoint fixtures.
+
+Not part of the default test run (see norecursedirs in pyproject.toml). Run
+with pytest-benchmark installed, e.g. ``pytest tests/benchmarks
+--benchmark-autosave`` and later ``--benchmark-compare-fail=mean:15%`` to flag
+regressions. Skipped when pytest-benchmark is not available.
+"""
+
+import pytest
+from python_switchos.endpoint import readDataclass
+from python_switchos.endpoints.link import LinkEndpoint
+from python_switchos.endpoints.sys import SystemEndpoint
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_bench_link_parse(benchmark, link_response):
+    benchmark.pedantic(readDataclass, args=(LinkEndpoint, link_response),
+                       rounds=50, warmup_rounds=5, iterations=100)
+
+
+def test_bench_sys_parse(benchmark, sys_response):
+    benchmark.pedantic(readDataclass, args=(SystemEndpoint, sys_response),
+                       rounds=50, warmup_rounds=5, iterations=100)
@@ -1,6 +1,13 @@
 import ast
+import json
 import pytest
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from python_switchos.endpoint import readDataclass
+from python_switchos.endpoints.link import LinkEndpoint
+from python_switchos.endpoints.poe import PoEEndpoint
+from python_switchos.endpoints.sys import SystemEndpoint
 
 FIXTURE_DIR = Path(__file__).parent / "fixtures"
 
@@ -12,12 +19,24 @@ _ENDPOINTS = {
 }
 
 
+def _load_expected(text):
+    """Load an .expected file, accepting Python dict literals as well as JSON."""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return ast.literal_eval(text)
+
+
+@lru_cache(maxsize=None)
 def discover_fixtures(endpoint_dir):
     """Discover response/expected fixture pairs in an endpoint directory.
 
     Finds files matching *_response_*.txt and pairs each with its
-    .expected file (Python dict literal). Returns list of
-    (response_text, expected_dict, fixture_id) tuples.
+    .expected file (JSON object). Returns list of
+    (response_text, expected_dict, fixture_id) tuples. Results are
+    cached, so each directory is read once per session rather than once
+    per test function that uses its fixtures; expected dicts are
+    read-only views since they are shared between tests.
     """
     path = FIXTURE_DIR / endpoint_dir
     if not path.exists():
@@ -28,7 +47,7 @@ def discover_fixtures(endpoint_dir):
         response_text = response_file.read_text()
         expected_dict = None
         if expected_file.exists():
-            expected_dict = ast.literal_eval(expected_file.read_text())
+            expected_dict = MappingProxyType(_load_expected(expected_file.read_text()))
         pairs.append((response_text, expected_dict, response_file.stem))
     return pairs
 
@@ -39,8 +58,30 @@ def fixture_dir():
     return FIXTURE_DIR
 
 
+@pytest.fixture(scope="session")
+def link_parsed(link_response):
+    """Return the LinkEndpoint parsed from a link.b fixture, once per session."""
+    return readDataclass(LinkEndpoint, link_response)
+
+
+@pytest.fixture(scope="session")
+def poe_parsed(poe_response):
+    """Return the PoEEndpoint parsed from a poe.b fixture, once per session."""
+    return readDataclass(PoEEndpoint, poe_response)
+
+
+@pytest.fixture(scope="session")
+def sys_parsed(sys_response):
+    """Return the SystemEndpoint parsed from a sys.b fixture, once per session."""
+    return readDataclass(SystemEndpoint, sys_response)
+
+
 def pytest_generate_tests(metafunc):
-    """Auto-parametrize fixtures based on discovered response files."""
+    """Auto-parametrize fixtures based on discovered response files.
+
+    Parameters are session-scoped, so fixtures derived from a response
+    (like link_parsed) are built once per fixture file.
+    """
     for name, endpoint_dir in _ENDPOINTS.items():
         response_param = f"{name}_response"
         expected_param = f"{name}_expected"
@@ -58,6 +99,7 @@ def pytest_generate_tests(metafunc):
                         reason=f"No fixtures in {endpoint_dir}/"))],
                     ids=["no_fixtures"],
                     indirect=False,
+                    scope="session",
                 )
             elif has_response:
                 metafunc.parametrize(
@@ -66,14 +108,28 @@ def pytest_generate_tests(metafunc):
                         reason=f"No fixtures in {endpoint_dir}/"))],
                     ids=["no_fixtures"],
                     indirect=False,
+                    scope="session",
                 )
             continue
         if has_response and has_expected:
+            # Only fixtures with an .expected file produce a test
+            pairs = [pair for pair in pairs if pair[1] is not None]
+            if not pairs:
+                metafunc.parametrize(
+                    f"{response_param},{expected_param}",
+                    [pytest.param(None, None, marks=pytest.mark.skip(
+                        reason=f"No .expected files in {endpoint_dir}/"))],
+                    ids=["no_expected"],
+                    indirect=False,
+                    scope="session",
+                )
+                continue
             metafunc.parametrize(
                 f"{response_param},{expected_param}",
                 [(r, e) for r, e, _ in pairs],
                 ids=[fid for _, _, fid in pairs],
                 indirect=False,
+                scope="session",
             )
         elif has_response:
             metafunc.parametrize(
@@ -81,4 +137,5 @@ def pytest_generate_tests(metafunc):
                 [r for r, _, _ in pairs],
                 ids=[fid for _, _, fid in pairs],
                 indirect=False,
+                scope="session",
             )
@@ -0,0 +1,78 @@
+"""Tests for Client.fetch and the HttpResponse body handling."""
+
+import pytest
+from python_switchos.client import Client
+from python_switchos.endpoint import readDataclass
+from python_switchos.endpoints.sys import SystemEndpoint
+from python_switchos.http import HttpClient, HttpResponse
+
+
+class TextResponse(HttpResponse):
+    """Response that only implements text(), so read() uses the base class fallback."""
+
+    def __init__(self, body: str):
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+    @property
+    def status(self) -> int:
+        return 200
+
+    def raise_for_status(self):
+        pass
+
+    async def text(self) -> str:
+        return self.body
+
+
+class BytesResponse(TextResponse):
+    """Response that returns the raw body from read(), like the aiohttp and httpx wrappers."""
+
+    def __init__(self, body: bytes):
+        super().__init__(body.decode(errors="replace"))
+        self.raw = body
+
+    async def read(self) -> bytes:
+        return self.raw
+
+
+class FakeHttpClient(HttpClient):
+    def __init__(self, response: HttpResponse):
+        self.response = response
+        self.urls = []
+
+    async def get(self, url) -> HttpResponse:
+        self.urls.append(url)
+        return self.response
+
+
+class TestHttpResponseRead:
+    @pytest.mark.asyncio
+    async def test_default_read_encodes_text(self):
+        assert await TextResponse("{upt:0x0a}").read() == b"{upt:0x0a}"
+
+
+class TestClientFetch:
+    @pytest.mark.asyncio
+    async def test_fetch_bytes_body(self, sys_response):
+        httpClient = FakeHttpClient(BytesResponse(sys_response.encode()))
+        result = await Client(httpClient, "http://switch/").fetch(SystemEndpoint)
+        assert httpClient.urls == ["http://switch/sys.b"]
+        assert result == readDataclass(SystemEndpoint, sys_response)
+
+    @pytest.mark.asyncio
+    async def test_fetch_with_default_read(self, sys_response):
+        result = await Client(FakeHttpClient(TextResponse(sys_response)), "http://switch").fetch(SystemEndpoint)
+        assert result == readDataclass(SystemEndpoint, sys_response)
+
+    @pytest.mark.asyncio
+    async def test_fetch_invalid_utf8_raises(self, sys_response):
+        """The raw body is decoded as UTF-8; undecodable bytes fail instead of being replaced."""
+        body = sys_response.rstrip().encode()[:-1] + b",x:'\xff'}"
+        with pytest.raises(UnicodeDecodeError):
+            await Client(FakeHttpClient(BytesResponse(body)), "http://switch").fetch(SystemEndpoint)
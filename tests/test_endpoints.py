@@ -0,0 +1,45 @@
+"""Tests shared by all endpoint classes."""
+
+import pytest
+from dataclasses import fields, is_dataclass
+from typing import get_args
+from python_switchos.endpoint import FieldType
+from python_switchos.endpoints import resolve_endpoint
+from python_switchos.endpoints.link import LinkEndpoint
+from python_switchos.endpoints.poe import PoEEndpoint
+from python_switchos.endpoints.sys import SystemEndpoint
+
+ENDPOINTS = [LinkEndpoint, PoEEndpoint, SystemEndpoint]
+FIELD_TYPES = frozenset(get_args(FieldType))
+ENDPOINT_FIELDS = [
+    pytest.param(f, id=f"{cls.__name__}.{f.name}") for cls in ENDPOINTS for f in fields(cls)
+]
+
+
+class TestEndpointStructure:
+    """Verify every endpoint follows the same metadata patterns."""
+
+    @pytest.mark.parametrize("cls", ENDPOINTS)
+    def test_is_dataclass(self, cls):
+        assert is_dataclass(cls)
+
+    @pytest.mark.parametrize("f", ENDPOINT_FIELDS)
+    def test_field_metadata(self, f):
+        names = f.metadata.get("name")
+        assert isinstance(names, list) and names, "needs a list of at least one name alias"
+        assert f.metadata.get("type") in FIELD_TYPES
+        if f.metadata["type"] == "option":
+            assert "options" in f.metadata
+        if "scale" in f.metadata:
+            assert isinstance(f.metadata["scale"], (int, float))
+
+
+class TestResolveEndpoint:
+    """Lookup of endpoint classes by their path."""
+
+    @pytest.mark.parametrize("cls", ENDPOINTS)
+    def test_resolves_endpoint_path(self, cls):
+        assert resolve_endpoint(cls.endpoint_path) is cls
+
+    def test_unknown_path(self):
+        assert resolve_endpoint("unknown.b") is None
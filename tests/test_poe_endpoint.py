@@ -5,131 +5,97 @@ tests run against every fixture file discovered in tests/fixtures/poe_b/.
 """
 
 import pytest
-from dataclasses import fields, asdict
-from typing import get_args
+from dataclasses import dataclass, field, fields, replace
+from typing import List, Optional, get_args
 from python_switchos.endpoint import readDataclass
 from python_switchos.endpoints.poe import PoEEndpoint, PoEOut, VoltageLevel, State
 
+OUT_VALID = frozenset(get_args(PoEOut)) | {None}
+VOLTAGE_LEVEL_VALID = frozenset(get_args(VoltageLevel)) | {None}
+STATE_VALID = frozenset(get_args(State)) | {None}
+
+# Per-port list fields with their allowed element types and values (None: unchecked)
+FIELD_SPECS = [
+    ("out", None, OUT_VALID),
+    ("voltage_level", None, VOLTAGE_LEVEL_VALID),
+    ("state", None, STATE_VALID),
+    ("lldp_enabled", {bool}, None),
+    ("lldp_power", {int, float}, None),
+    ("voltage", {int, float}, None),
+    ("power", {int, float}, None),
+    ("priority", {int}, None),
+    ("current", {int}, None),
+]
 
-class TestPoEEndpointStructure:
-    """Verify PoEEndpoint follows the same metadata patterns as other endpoints."""
 
-    def test_is_dataclass(self):
-        assert hasattr(PoEEndpoint, "__dataclass_fields__")
+class TestPoEEndpointStructure:
+    """PoEEndpoint specifics; shared metadata checks live in test_endpoints.py."""
 
     def test_endpoint_path(self):
         assert PoEEndpoint.endpoint_path == "poe.b"
 
-    def test_fields_have_required_metadata(self):
-        for f in fields(PoEEndpoint):
-            assert "name" in f.metadata, f"Field {f.name} missing 'name' metadata"
-            assert "type" in f.metadata, f"Field {f.name} missing 'type' metadata"
-
-    def test_name_metadata_is_list(self):
-        for f in fields(PoEEndpoint):
-            assert isinstance(f.metadata["name"], list), (
-                f"Field {f.name} 'name' should be a list"
-            )
-
-    def test_name_metadata_has_aliases(self):
-        for f in fields(PoEEndpoint):
-            assert len(f.metadata["name"]) >= 1, (
-                f"Field {f.name} needs at least one name alias"
-            )
-
-    def test_option_fields_have_options(self):
-        for f in fields(PoEEndpoint):
-            if f.metadata.get("type") == "option":
-                assert "options" in f.metadata, (
-                    f"Option field {f.name} missing 'options' metadata"
-                )
-
-    def test_scale_values_are_numeric(self):
-        for f in fields(PoEEndpoint):
-            if "scale" in f.metadata:
-                assert isinstance(f.metadata["scale"], (int, float)), (
-                    f"Field {f.name} scale should be numeric, "
-                    f"got {type(f.metadata['scale'])}"
-                )
-
     def test_has_expected_field_count(self):
         """PoEEndpoint should have 9 fields."""
         assert len(fields(PoEEndpoint)) == 9
 
-    def test_type_values_are_valid(self):
-        valid_types = {"bool", "int", "str", "option", "mac", "ip"}
-        for f in fields(PoEEndpoint):
-            assert f.metadata["type"] in valid_types, (
-                f"Field {f.name} has unexpected type '{f.metadata['type']}'"
-            )
-
 
 class TestPoEEndpointParsing:
     """Generic parsing tests that run against all poe.b fixtures."""
 
-    def test_parses_to_poe_endpoint(self, poe_response):
-        result = readDataclass(PoEEndpoint, poe_response)
+    def test_parses_to_poe_endpoint(self, poe_parsed):
+        result = poe_parsed
         assert isinstance(result, PoEEndpoint)
 
-    def test_out_values_are_valid(self, poe_response):
-        result = readDataclass(PoEEndpoint, poe_response)
-        if result.out is None:
-            pytest.skip("out field not in response")
-        valid = set(get_args(PoEOut)) | {None}
-        assert all(v in valid for v in result.out)
-
-    def test_voltage_level_values_are_valid(self, poe_response):
-        result = readDataclass(PoEEndpoint, poe_response)
-        if result.voltage_level is None:
-            pytest.skip("voltage_level field not in response")
-        valid = set(get_args(VoltageLevel)) | {None}
-        assert all(v in valid for v in result.voltage_level)
-
-    def test_state_values_are_valid(self, poe_response):
-        result = readDataclass(PoEEndpoint, poe_response)
-        if result.state is None:
-            pytest.skip("state field not in response")
-        valid = set(get_args(State)) | {None}
-        assert all(v in valid for v in result.state)
-
-    def test_lldp_enabled_is_bool_list(self, poe_response):
-        result = readDataclass(PoEEndpoint, poe_response)
-        if result.lldp_enabled is None:
-            pytest.skip("lldp_enabled field not in response")
-        assert isinstance(result.lldp_enabled, list)
-        assert all(isinstance(v, bool) for v in result.lldp_enabled)
-
-    def test_scaled_fields_are_float(self, poe_response):
-        result = readDataclass(PoEEndpoint, poe_response)
-        for name in ("lldp_power", "voltage", "power"):
-            val = getattr(result, name)
-            if val is None:
-                continue
-            assert isinstance(val, list), f"{name} should be a list"
-            assert all(isinstance(v, (int, float)) for v in val), (
-                f"{name} values should be numeric"
-            )
-
-    def test_int_fields_are_int_list(self, poe_response):
-        result = readDataclass(PoEEndpoint, poe_response)
-        for name in ("priority", "current"):
-            val = getattr(result, name)
-            if val is None:
-                continue
-            assert isinstance(val, list), f"{name} should be a list"
-            assert all(isinstance(v, int) for v in val), (
-                f"{name} values should be int"
-            )
+    @pytest.mark.parametrize("field,types,valid", FIELD_SPECS)
+    def test_field_values(self, poe_parsed, field, types, valid):
+        values = getattr(poe_parsed, field)
+        if values is None:
+            pytest.skip(f"{field} field not in response")
+        assert isinstance(values, list), f"{field} should be a list"
+        if types is not None:
+            assert set(map(type, values)) <= types, f"{field} has unexpected value types"
+        if valid is not None:
+            assert set(values) <= valid, f"{field} has invalid values"
+
+
+class TestPoEEndpointIntFields:
+    """Per-port int fields are converted element-wise, with scaling where configured."""
+
+    def test_list_int_fields(self):
+        result = readDataclass(PoEEndpoint, "{i05:[0x0a,0x00],i06:[0x01e0,0x0000]}")
+        assert result.current == [10, 0]
+        assert result.voltage == [48.0, 0.0]
+
+
+@dataclass
+class _OptionalListInt:
+    values: Optional[List[float]] = field(metadata={"name": ["i01"], "type": "int", "scale": 10}, default=None)
+
+
+@dataclass
+class _StringListInt:
+    values: "List[float]" = field(metadata={"name": ["i01"], "type": "int", "scale": 10}, default=None)
+
+
+@dataclass
+class _UnresolvedInt:
+    values: "Undefined" = field(metadata={"name": ["i01"], "type": "int", "scale": 10}, default=None)  # noqa: F821
+
+
+class TestIntFieldAnnotations:
+    """The int conversion follows the resolved annotation, whatever form it is written in."""
+
+    @pytest.mark.parametrize("cls", [_OptionalListInt, _StringListInt, _UnresolvedInt])
+    def test_list_payload(self, cls):
+        assert readDataclass(cls, "{i01:[0x0a,0x14]}").values == [1.0, 2.0]
+
+    def test_unresolved_annotation_scalar_payload(self):
+        assert readDataclass(_UnresolvedInt, "{i01:0x0a}").values == 1.0
 
 
 class TestPoEEndpointExpectedValues:
     """Compare parsed results against expected values from .expected files."""
 
-    def test_expected_values(self, poe_response, poe_expected):
-        if poe_expected is None:
-            pytest.skip("No .expected file for this fixture")
-        result = asdict(readDataclass(PoEEndpoint, poe_response))
-        for field, expected in poe_expected.items():
-            assert result[field] == expected, (
-                f"Field {field!r}: expected {expected!r}, got {result[field]!r}"
-            )
+    def test_expected_values(self, poe_parsed, poe_expected):
+        result = poe_parsed
+        assert result == replace(result, **poe_expected)
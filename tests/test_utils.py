@@ -2,12 +2,19 @@
 
 from typing import Literal
 
+import pytest
+
 from python_switchos.utils import (
     hex_to_bool_list,
     hex_to_str,
     hex_to_option,
     hex_to_mac,
+    hex_to_mac_list,
     hex_to_ip,
+    hex_to_ip_list,
+    process_int,
+    process_int_list,
+    process_int_scalar,
     str_to_json,
 )
 
@@ -15,99 +22,122 @@ from python_switchos.utils import (
 # --- hex_to_bool_list ---
 
 class TestHexToBoolList:
-    def test_all_true(self):
-        """0x3ff with 10 bits = all True."""
-        result = hex_to_bool_list(0x03FF, 10)
-        assert result == [True] * 10
-
-    def test_all_false(self):
-        """Zero value produces all False."""
-        result = hex_to_bool_list(0, 10)
-        assert result == [False] * 10
-
-    def test_basic_conversion(self):
-        """Binary 1010 = bit0=0, bit1=1, bit2=0, bit3=1 (LSB-first)."""
-        result = hex_to_bool_list(0b1010, 4)
-        assert result == [False, True, False, True]
-
-    def test_single_bit_lsb(self):
-        """0x200 (bit 9 set) with 10 bits.
-        LSB-first: bit 9 maps to index 9 (last port)."""
-        result = hex_to_bool_list(0x200, 10)
-        assert result[9] is True
-        assert all(v is False for v in result[:9])
-
-    def test_returns_correct_length(self):
-        result = hex_to_bool_list(0xFF, 8)
-        assert len(result) == 8
-
-    def test_padding(self):
-        """Value 1 = only bit 0 set. LSB-first: first element is True."""
-        result = hex_to_bool_list(1, 8)
-        assert len(result) == 8
-        assert result[0] is True
-        assert all(v is False for v in result[1:])
+    @pytest.mark.parametrize("value,length,expected", [
+        pytest.param(0x03FF, 10, [True] * 10, id="all_true"),
+        pytest.param(0, 10, [False] * 10, id="all_false"),
+        # LSB-first: bit0=0, bit1=1, bit2=0, bit3=1
+        pytest.param(0b1010, 4, [False, True, False, True], id="basic_conversion"),
+        # Bit 9 maps to index 9 (last port)
+        pytest.param(0x200, 10, [False] * 9 + [True], id="single_bit_lsb"),
+        pytest.param(0xFF, 8, [True] * 8, id="full_byte"),
+        pytest.param(1, 8, [True] + [False] * 7, id="padding"),
+    ])
+    def test_hex_to_bool_list(self, value, length, expected):
+        assert hex_to_bool_list(value, length) == expected
 
 
 # --- hex_to_str ---
 
 class TestHexToStr:
-    def test_basic_decode(self):
-        """'506f727431' decodes to 'Port1'."""
-        assert hex_to_str("506f727431") == "Port1"
-
-    def test_empty_string(self):
-        assert hex_to_str("") == ""
-
-    def test_ascii_characters(self):
-        """'48656c6c6f' decodes to 'Hello'."""
-        assert hex_to_str("48656c6c6f") == "Hello"
+    @pytest.mark.parametrize("value,expected", [
+        pytest.param("506f727431", "Port1", id="basic_decode"),
+        pytest.param("", "", id="empty_string"),
+        pytest.param("48656c6c6f", "Hello", id="ascii_characters"),
+    ])
+    def test_hex_to_str(self, value, expected):
+        assert hex_to_str(value) == expected
 
 
 # --- hex_to_option ---
 
 class TestHexToOption:
-    def test_first_option(self):
-        TestLiteral = Literal["a", "b", "c"]
-        assert hex_to_option(0, TestLiteral) == "a"
+    @pytest.mark.parametrize("value,expected", [
+        pytest.param(0, "a", id="first_option"),
+        pytest.param(1, "b", id="middle_option"),
+        pytest.param(2, "c", id="last_option"),
+        pytest.param(5, None, id="out_of_range"),
+    ])
+    def test_hex_to_option(self, value, expected):
+        assert hex_to_option(value, Literal["a", "b", "c"]) == expected
 
-    def test_last_option(self):
-        TestLiteral = Literal["a", "b", "c"]
-        assert hex_to_option(2, TestLiteral) == "c"
 
-    def test_out_of_range(self):
-        TestLiteral = Literal["a", "b", "c"]
-        assert hex_to_option(5, TestLiteral) is None
+# --- hex_to_mac ---
 
-    def test_middle_option(self):
-        TestLiteral = Literal["a", "b", "c"]
-        assert hex_to_option(1, TestLiteral) == "b"
+class TestHexToMac:
+    @pytest.mark.parametrize("value,expected", [
+        pytest.param("001122334455", "00:11:22:33:44:55", id="basic_mac"),
+        # Lowercase hex input produces an uppercase MAC
+        pytest.param("aabbccddeeff", "AA:BB:CC:DD:EE:FF", id="lowercase_input"),
+    ])
+    def test_hex_to_mac(self, value, expected):
+        assert hex_to_mac(value) == expected
 
 
-# --- hex_to_mac ---
+# --- hex_to_mac_list ---
 
-class TestHexToMac:
-    def test_basic_mac(self):
-        assert hex_to_mac("001122334455") == "00:11:22:33:44:55"
+class TestHexToMacList:
+    def test_multiple_macs(self):
+        result = hex_to_mac_list(["001122334455", "aabbccddeeff"])
+        assert result == ["00:11:22:33:44:55", "AA:BB:CC:DD:EE:FF"]
+
+    def test_empty_list(self):
+        assert hex_to_mac_list([]) == []
+
+    def test_irregular_lengths(self):
+        """Entries that are not 12 hex digits fall back to per-entry conversion."""
+        assert hex_to_mac_list(["", "001122334455"]) == ["", "00:11:22:33:44:55"]
+
+
+# --- process_int ---
+
+class TestProcessInt:
+    def test_plain_value(self):
+        assert process_int(42) == 42
+
+    def test_signed_scalar(self):
+        """0xffd3 as signed 16 bit = -45."""
+        assert process_int(0xFFD3, True, 16) == -45
 
-    def test_lowercase_input(self):
-        """Input lowercase hex should produce uppercase MAC."""
-        assert hex_to_mac("aabbccddeeff") == "AA:BB:CC:DD:EE:FF"
+    def test_scaled_scalar(self):
+        assert process_int(2405, scale=100) == 24.05
+
+    def test_signed_and_scaled_list(self):
+        assert process_int([0xFFF6, 0x000A, 0], True, 16, 10) == [-1.0, 1.0, 0.0]
+
+    def test_signed_list(self):
+        assert process_int([0x80, 0x7F], True, 8) == [-128, 127]
+
+    def test_scaled_list(self):
+        assert process_int([5, 10], scale=10) == [0.5, 1.0]
+
+    def test_scalar_variant(self):
+        assert process_int_scalar(0xFFF6, True, 16, 10) == -1.0
+
+    def test_list_variant(self):
+        assert process_int_list([0xFFF6, 0x000A], True, 16) == [-10, 10]
 
 
 # --- hex_to_ip ---
 
 class TestHexToIp:
-    def test_private_ip(self):
-        """Little-endian 0x0101a8c0 -> 192.168.1.1."""
-        assert hex_to_ip(0x0101A8C0) == "192.168.1.1"
+    @pytest.mark.parametrize("value,expected", [
+        # Little-endian byte order
+        pytest.param(0x0101A8C0, "192.168.1.1", id="private_ip"),
+        pytest.param(0x0100007F, "127.0.0.1", id="localhost"),
+        pytest.param(0, "0.0.0.0", id="zero"),
+    ])
+    def test_hex_to_ip(self, value, expected):
+        assert hex_to_ip(value) == expected
+
+
+# --- hex_to_ip_list ---
 
-    def test_localhost(self):
-        """Little-endian 0x0100007f -> 127.0.0.1."""
-        assert hex_to_ip(0x0100007F) == "127.0.0.1"
+class TestHexToIpList:
+    def test_multiple_ips(self):
+        assert hex_to_ip_list([0x0101A8C0, 0x0100007F, 0]) == ["192.168.1.1", "127.0.0.1", "0.0.0.0"]
 
-    def test_zero(self):
-        assert hex_to_ip(0) == "0.0.0.0"
+    def test_empty_list(self):
+        assert hex_to_ip_list([]) == []
 
 
 # --- str_to_json ---
@@ -126,3 +156,28 @@ class TestStrToJson:
     def test_hex_value_parsed(self):
         result = str_to_json("{i01:0x03ff}")
         assert result["i01"] == 0x03FF
+
+    def test_quoted_strings(self):
+        result = str_to_json("{i01:'506f7274',\"i02\":\"a\\'b\"}")
+        assert result == {"i01": "506f7274", "i02": "a'b"}
+
+    def test_list_of_objects(self):
+        result = str_to_json("[{i01:0x01,i02:[0x02,0x03]},{i01:0x04}]")
+        assert result == [{"i01": 1, "i02": [2, 3]}, {"i01": 4}]
+
+    def test_trailing_comma_and_whitespace(self):
+        result = str_to_json(" { i01 : [ 0x01 , 0x02 , ] , } ")
+        assert result == {"i01": [1, 2]}
+
+    def test_bytes_input(self):
+        result = str_to_json(b"{i01:0x03ff,i02:'506f7274'}")
+        assert result == {"i01": 0x03FF, "i02": "506f7274"}
+
+    @pytest.mark.parametrize("value", ["{i01:NaN}", "{i01:[Infinity]}", "{i01:-Infinity}"])
+    def test_non_finite_constants_raise(self, value):
+        with pytest.raises(ValueError):
+            str_to_json(value)
+
+    def test_invalid_raises(self):
+        with pytest.raises(ValueError):
+            str_to_json("{i01:0x01")